@@ -1,30 +1,117 @@
-import json
+import contextlib
+import os
 from flask import Flask, request, jsonify, render_template
 import numpy as np
 import re
-from collections import Counter
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import language_tool_python
 
 # --- NLP / SEMANTIC SCORING LIBRARIES ---
-# IMPORTANT: Try to import SentenceTransformer and handle the ImportError if not installed.
+# Threads used for model inference (PyTorch intra-op pool or ONNX Runtime session).
+# Set INFERENCE_THREADS=1 when running several Gunicorn workers to avoid oversubscribing cores.
+INFERENCE_THREADS = int(os.environ.get("INFERENCE_THREADS", os.cpu_count() or 4))
+
+# Optional int8-quantized ONNX export of all-MiniLM-L6-v2 (created by export_onnx.py).
+# When present and onnxruntime is installed it is used instead of the PyTorch model.
+# The default is resolved next to app.py so it does not depend on the working directory.
+ONNX_MODEL_PATH = os.environ.get(
+    "ONNX_MODEL_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "onnx-minilm", "model-int8.onnx"),
+)
+
+
+class OnnxSentenceEncoder:
+    """
+    Drop-in replacement for SentenceTransformer.encode backed by ONNX Runtime.
+    Reproduces the all-MiniLM-L6-v2 pipeline: tokenize -> transformer -> mean pooling -> (L2 norm).
+    """
+
+    def __init__(self, model_path, max_seq_length=256):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        options = ort.SessionOptions()
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = INFERENCE_THREADS
+        self.session = ort.InferenceSession(model_path, sess_options=options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        self.tokenizer = AutoTokenizer.from_pretrained(os.path.dirname(model_path) or ".")
+        self.max_seq_length = max_seq_length
+
+    def encode(self, sentences, batch_size=32, normalize_embeddings=False, convert_to_numpy=True, show_progress_bar=False):
+        single = isinstance(sentences, str)
+        if single:
+            sentences = [sentences]
+
+        # Process longest first so each batch pads to a similar length
+        order = np.argsort([-len(s) for s in sentences], kind="stable")
+        batches = []
+        for start in range(0, len(sentences), batch_size):
+            batch = [sentences[i] for i in order[start:start + batch_size]]
+            features = self.tokenizer(batch, padding=True, truncation=True, max_length=self.max_seq_length, return_tensors="np")
+            inputs = {k: v.astype(np.int64) for k, v in features.items() if k in self.input_names}
+            token_embeddings = self.session.run(None, inputs)[0]
+
+            # Mean pooling over real (non-padding) tokens
+            mask = features["attention_mask"][..., None].astype(np.float32)
+            pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            if normalize_embeddings:
+                pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+            batches.append(pooled.astype(np.float32))
+
+        # Restore the caller's order
+        embeddings = np.concatenate(batches)[np.argsort(order)]
+        return embeddings[0] if single else embeddings
+
+
+model = None
+inference_context = contextlib.nullcontext
+SEMANTIC_SCORING_ENABLED = False
+
+if os.path.exists(ONNX_MODEL_PATH):
+    try:
+        print(f"Loading int8 ONNX model: {ONNX_MODEL_PATH}...")
+        model = OnnxSentenceEncoder(ONNX_MODEL_PATH)
+        SEMANTIC_SCORING_ENABLED = True
+        print("ONNX model loaded successfully.")
+    except Exception as e:
+        print(f"WARNING: Failed to load ONNX model, falling back to PyTorch. Error: {e}")
+
+if model is None:
+    # IMPORTANT: Try to import SentenceTransformer and handle the ImportError if not installed.
+    try:
+        import torch
+        from sentence_transformers import SentenceTransformer
+        # Pin intra-op parallelism instead of PyTorch's default guess (autograd is disabled
+        # per call via inference_mode, since grad mode is thread-local)
+        torch.set_num_threads(INFERENCE_THREADS)
+        print("Loading Sentence Transformer model: all-MiniLM-L6-v2...")
+        model = SentenceTransformer('all-MiniLM-L6-v2')
+        inference_context = torch.inference_mode
+        SEMANTIC_SCORING_ENABLED = True
+        print("Model loaded successfully.")
+    except ImportError:
+        print("WARNING: Sentence-Transformers not found. Semantic scoring (Flow) will be disabled.")
+    except Exception as e:
+        print(f"ERROR: Failed to load Sentence Transformer model. Semantic scoring disabled. Error: {e}")
+
+# --- KEYWORD MATCHING LIBRARY ---
+# Optional: pyahocorasick matches all required keywords in a single pass over the transcript.
 try:
-    from sentence_transformers import SentenceTransformer
-    from sklearn.metrics.pairwise import cosine_similarity
-    SEMANTIC_SCORING_ENABLED = True
-    print("Loading Sentence Transformer model: all-MiniLM-L6-v2...")
-    model = SentenceTransformer('all-MiniLM-L6-v2')
-    print("Model loaded successfully.")
+    import ahocorasick
+    AHOCORASICK_ENABLED = True
 except ImportError:
-    SEMANTIC_SCORING_ENABLED = False
-    print("WARNING: Sentence-Transformers or Scikit-learn not found. Semantic scoring (Flow) will be disabled.")
-except Exception as e:
-    SEMANTIC_SCORING_ENABLED = False
-    print(f"ERROR: Failed to load Sentence Transformer model. Semantic scoring disabled. Error: {e}")
+    AHOCORASICK_ENABLED = False
+    print("WARNING: pyahocorasick not found. Falling back to per-keyword substring search.")
 
 # --- GRAMMAR CHECKING LIBRARY ---
 try:
     # Initialize the LanguageTool. This can take a moment.
     grammar_tool = language_tool_python.LanguageTool('en-US')
+    # Warm up the Java server so the first user request does not pay its start-up cost
+    grammar_tool.check("Warm up sentence.")
     GRAMMAR_CHECK_ENABLED = True
     print("Language Tool for Grammar initialized.")
 except Exception as e:
@@ -44,34 +131,100 @@ TARGET_FLOW_DESCRIPTION = (
     "and concluding with a polite Closing/Thank You."
 )
 
+# One short description per rubric section. These do not affect the flow score; they only
+# point the feedback at the section the transcript covers least.
+TARGET_SECTIONS = {
+    "Greeting": "A polite salutation or greeting to the audience, such as Good morning everyone.",
+    "Name & Age": "Stating my name and my age.",
+    "Class & School": "Mentioning the class I study in and the name of my school.",
+    "Family": "Talking about my family and the people I live with.",
+    "Hobbies & Interests": "Describing my hobbies, interests and what I like to do in my free time.",
+    "Unique Point": "Sharing a fun fact or a unique point about myself.",
+    "Closing": "Concluding politely by thanking the audience for listening.",
+}
+TARGET_SECTION_NAMES = list(TARGET_SECTIONS)
+
+# Options shared by every encode call. Embeddings are L2-normalized inside the model's
+# batch kernel, so all downstream similarities are plain dot products.
+ENCODE_KWARGS = {"normalize_embeddings": True, "convert_to_numpy": True, "show_progress_bar": False}
+
+# The targets are fixed, so embed them once at startup instead of on every request.
+# Row 0 is the full flow description, rows 1.. are the sections: shape (1 + n_sections, dim),
+# so one matrix-vector product gives a transcript's similarity to every target.
+if SEMANTIC_SCORING_ENABLED:
+    with inference_context():
+        # float32, C-contiguous so the per-request product maps straight onto BLAS sgemv
+        TARGET_EMBEDDINGS = np.ascontiguousarray(
+            model.encode([TARGET_FLOW_DESCRIPTION, *TARGET_SECTIONS.values()], **ENCODE_KWARGS), dtype=np.float32
+        )
+        # Warm-up pass: initializes kernels and thread pools outside the request path
+        model.encode("Warmup sentence for kernel initialization.", **ENCODE_KWARGS)
+
 # List of keywords required for the Key Content Presence (30 points)
-REQUIRED_KEYWORDS = [
+# Immutable and lowercased at import, since transcripts are matched in lowercase.
+REQUIRED_KEYWORDS = tuple(kw.lower() for kw in [
     'name', 'age', 'class', 'school', 'family', 'hobbies', 'interests', 'goals', 'unique point', 'subject', 'cricket', 'kind hearted', 'soft spoken'
-]
+])
+
+# Multi-pattern automaton over REQUIRED_KEYWORDS, built once at startup
+if AHOCORASICK_ENABLED:
+    KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for kw in REQUIRED_KEYWORDS:
+        KEYWORD_AUTOMATON.add_word(kw, kw)
+    KEYWORD_AUTOMATON.make_automaton()
 
 # List of common filler words for Clarity (10 points)
-FILLER_WORDS = set([
+FILLER_WORDS = frozenset(w.lower() for w in [
     'um', 'uh', 'like', 'you know', 'so', 'actually', 'basically', 'right', 
     'i mean', 'well', 'kinda', 'sort of', 'okay', 'hmm', 'ah', 'and then', 
     'at the end of the day', 'literally'
 ])
 
+# Word tokenizer shared by all scorers (transcripts are tokenized once per request)
+_WORD_RE = re.compile(r'\b\w+\b')
+
+# Minimum word count for a transcript to be scored (enforced by calculate_final_score)
+MIN_TRANSCRIPT_WORDS = 10
+
+# Single-word fillers are counted on the shared token list with C-level set lookups; only
+# multi-word phrases ('you know', 'at the end of the day') need a regex pass over the text.
+# None of the phrases contains a single-word filler, so the two counts never overlap.
+_SINGLE_FILLER_WORDS = frozenset(f for f in FILLER_WORDS if ' ' not in f)
+_FILLER_PHRASE_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(f) for f in sorted(FILLER_WORDS - _SINGLE_FILLER_WORDS, key=len, reverse=True)) + r')\b'
+)
+
 # --- SCORING LOGIC ---
 
-def calculate_key_content_presence(transcript):
+# Cache the expensive model calls so a resubmitted transcript is a dictionary lookup.
+# Callers must treat the returned embedding / match list as read-only.
+@lru_cache(maxsize=512)
+def _embed(text):
+    with inference_context():
+        embedding = np.ascontiguousarray(model.encode(text, **ENCODE_KWARGS), dtype=np.float32)
+    # Shared between requests through the cache, so guard against accidental mutation
+    embedding.flags.writeable = False
+    return embedding
+
+@lru_cache(maxsize=512)
+def _grammar_check(text):
+    return grammar_tool.check(text)
+
+def calculate_key_content_presence(transcript_lower):
     """
     Criterion: Key Content Presence (Weight: 30)
-    Metric: Presence of REQUIRED_KEYWORDS.
+    Metric: Presence of REQUIRED_KEYWORDS in the lowercased transcript.
     """
-    transcript_lower = transcript.lower()
-    found_count = 0
     total_required = len(REQUIRED_KEYWORDS)
-    found_details = []
 
-    for keyword in REQUIRED_KEYWORDS:
-        if keyword in transcript_lower:
-            found_count += 1
-            found_details.append(keyword)
+    if AHOCORASICK_ENABLED:
+        found = {kw for _, kw in KEYWORD_AUTOMATON.iter(transcript_lower)}
+        # Keep rubric order for the feedback message
+        found_details = [kw for kw in REQUIRED_KEYWORDS if kw in found]
+    else:
+        # For 13 short keywords, C-level `in` substring checks beat a compiled alternation regex
+        found_details = [kw for kw in REQUIRED_KEYWORDS if kw in transcript_lower]
+    found_count = len(found_details)
 
     # Score is proportional to the percentage of keywords found (normalized to 100)
     score_raw = (found_count / total_required) * 100
@@ -95,10 +248,26 @@ def calculate_key_content_presence(transcript):
         "raw_score_30": (score / 100) * weight # Weighted score out of 30
     }
 
-def calculate_flow_and_organization(transcript):
+def calculate_flow_similarities(transcripts):
+    """
+    Embeds many transcripts in one encode call and returns their similarity to each target
+    (flow description, then each section), shape (n_transcripts, 1 + n_sections).
+    Inputs are sorted by length (longest first) so each batch carries minimal padding.
+    """
+    order = sorted(range(len(transcripts)), key=lambda i: len(transcripts[i]), reverse=True)
+    with inference_context():
+        sorted_embeddings = model.encode([transcripts[i] for i in order], batch_size=32, **ENCODE_KWARGS)
+
+    # Undo the length sort, then score every transcript against every target in one product
+    embeddings = np.empty(sorted_embeddings.shape, dtype=np.float32)
+    embeddings[order] = sorted_embeddings
+    return embeddings @ TARGET_EMBEDDINGS.T
+
+def calculate_flow_and_organization(transcript, target_similarities=None):
     """
     Criterion: Flow (Weight: 5)
     Metric: Semantic similarity to the ideal structure/flow.
+    Precomputed target similarities (e.g. from calculate_flow_similarities) skip the embedding step.
     """
     weight = 5
     if not SEMANTIC_SCORING_ENABLED:
@@ -113,11 +282,18 @@ def calculate_flow_and_organization(transcript):
             "raw_score_5": (score / 100) * weight
         }
 
-    # 1. Embed the transcript and the target description
-    embeddings = model.encode([transcript, TARGET_FLOW_DESCRIPTION])
-    
-    # 2. Calculate cosine similarity between the transcript and the target flow
-    similarity = cosine_similarity([embeddings[0]], [embeddings[1]])[0][0]
+    if target_similarities is None:
+        # 1. Embed the transcript (the target embeddings are precomputed at startup)
+        transcript_emb = _embed(transcript)
+
+        # 2. All embeddings are unit-normalized, so one matvec gives the cosine similarity per target
+        target_similarities = TARGET_EMBEDDINGS @ transcript_emb
+
+    # The score uses the full-description similarity; the sections only drive the hint
+    similarity = float(target_similarities[0])
+    section_similarities = target_similarities[1:]
+    weakest = int(np.argmin(section_similarities))
+    weakest_section = f"Least covered section: {TARGET_SECTION_NAMES[weakest]} ({float(section_similarities[weakest]):.2f})."
     
     # 3. Normalize similarity (0 to 1) to a score (0 to 100).
     score_raw = max(0, similarity * 125 - 50)
@@ -126,9 +302,9 @@ def calculate_flow_and_organization(transcript):
     if score >= 80:
         feedback = f"Excellent structure. The introduction follows a logical, organized flow. Semantic similarity: {similarity:.2f}"
     elif score >= 50:
-        feedback = f"Good structure. The major sections are present, but the order could be improved for a smoother presentation. Semantic similarity: {similarity:.2f}"
+        feedback = f"Good structure. The major sections are present, but some could be developed further for a smoother presentation. Semantic similarity: {similarity:.2f}. {weakest_section}"
     else:
-        feedback = f"The flow is confusing. Try to reorder sections to follow the standard self-introduction structure. Semantic similarity: {similarity:.2f}"
+        feedback = f"The flow is confusing. Try to cover each section of the standard self-introduction structure. Semantic similarity: {similarity:.2f}. {weakest_section}"
         
     return {
         "name": "Flow & Organization (Semantic)",
@@ -138,15 +314,25 @@ def calculate_flow_and_organization(transcript):
         "raw_score_5": (score / 100) * weight
     }
 
-def calculate_type_token_ratio(transcript):
+# Score bands as lookup tables: bisect finds the band, index i selects score and feedback.
+# TTR bands are inclusive lower bounds (ttr >= threshold), hence bisect_right.
+_TTR_THRESHOLDS = [0.3, 0.5, 0.7, 0.9]
+_TTR_SCORES = [20, 40, 60, 80, 100]  # Rubric: 0-0.29, 0.3-0.49, 0.5-0.69, 0.7-0.89, 0.9-1.0
+_TTR_FEEDBACK = [
+    "Very limited vocabulary (TTR: {ttr:.2f}). Needs significant improvement in word choice variety.",
+    "Limited vocabulary (TTR: {ttr:.2f}). Too much repetition of common words.",
+    "Average vocabulary (TTR: {ttr:.2f}). Consider using more varied language.",
+    "Good vocabulary (TTR: {ttr:.2f}). The word choices are diverse.",
+    "Excellent vocabulary (TTR: {ttr:.2f}). You used a high diversity of words.",
+]
+
+def calculate_type_token_ratio(words):
     """
     Criterion: Vocabulary Richness (TTR) (Weight: 10)
     Metric: Type-Token Ratio (TTR = Distinct words / Total words)
     """
     weight = 10
     
-    # Clean the transcript (remove punctuation)
-    words = re.findall(r'\b\w+\b', transcript.lower())
     total_words = len(words)
     distinct_words = len(set(words))
     
@@ -156,22 +342,10 @@ def calculate_type_token_ratio(transcript):
         ttr = distinct_words / total_words
 
     # Score mapping based on the rubric (TTR range -> Score 0-100 equivalent)
-    if ttr >= 0.9:
-        score = 100  # Rubric: 0.9 - 1.0
-        feedback = f"Excellent vocabulary (TTR: {ttr:.2f}). You used a high diversity of words."
-    elif ttr >= 0.7:
-        score = 80   # Rubric: 0.7 - 0.89
-        feedback = f"Good vocabulary (TTR: {ttr:.2f}). The word choices are diverse."
-    elif ttr >= 0.5:
-        score = 60   # Rubric: 0.5 - 0.69
-        feedback = f"Average vocabulary (TTR: {ttr:.2f}). Consider using more varied language."
-    elif ttr >= 0.3:
-        score = 40   # Rubric: 0.3 - 0.49
-        feedback = f"Limited vocabulary (TTR: {ttr:.2f}). Too much repetition of common words."
-    else:
-        score = 20   # Rubric: 0 - 0.29
-        feedback = f"Very limited vocabulary (TTR: {ttr:.2f}). Needs significant improvement in word choice variety."
-        
+    band = bisect_right(_TTR_THRESHOLDS, ttr)
+    score = _TTR_SCORES[band]
+    feedback = _TTR_FEEDBACK[band].format(ttr=ttr)
+
     return {
         "name": "Vocabulary Richness (TTR)",
         "score": score,
@@ -180,6 +354,14 @@ def calculate_type_token_ratio(transcript):
         "raw_score_10": (score / 100) * weight
     }
 
+# Grammar feedback bands over the 0-100 score (score >= 50: minor, score >= 90: excellent)
+_GRAMMAR_THRESHOLDS = [50, 90]
+_GRAMMAR_FEEDBACK = [
+    "Significant grammar issues (Errors/100 words: {errors_per_100:.2f}). Total errors found: {error_count}. Major errors include: {examples}.",
+    "Minor grammatical issues (Errors/100 words: {errors_per_100:.2f}). Total errors found: {error_count}. Review sentences like: {examples}.",
+    "Excellent grammar (Errors/100 words: {errors_per_100:.2f}). Total errors found: {error_count}.",
+]
+
 def calculate_grammar_score(transcript, total_words):
     """
     Criterion: Language & Grammar (Weight: 10)
@@ -208,7 +390,7 @@ def calculate_grammar_score(transcript, total_words):
         }
 
     # Use the Language Tool to find matches (errors)
-    matches = grammar_tool.check(transcript)
+    matches = _grammar_check(transcript)
     error_count = len(matches)
     
     # Calculate errors per 100 words
@@ -218,16 +400,15 @@ def calculate_grammar_score(transcript, total_words):
     rubric_score_0_1 = 1 - min(errors_per_100 / 10, 1)
     score = round(rubric_score_0_1 * 100)
 
-    # Compile a list of specific error messages for feedback
-    error_messages = [f"'{m.context}' -> Suggestion: {m.replacements}" for m in matches[:5]]
-    
-    if score >= 90:
-        feedback = f"Excellent grammar (Errors/100 words: {errors_per_100:.2f}). Total errors found: {error_count}."
-    elif score >= 50:
-        feedback = f"Minor grammatical issues (Errors/100 words: {errors_per_100:.2f}). Total errors found: {error_count}. Review sentences like: {'; '.join(error_messages)}."
+    band = bisect_right(_GRAMMAR_THRESHOLDS, score)
+    if band == len(_GRAMMAR_THRESHOLDS):
+        # Excellent band (covers error_count == 0); no need to build the example error list
+        examples = ""
     else:
-        feedback = f"Significant grammar issues (Errors/100 words: {errors_per_100:.2f}). Total errors found: {error_count}. Major errors include: {'; '.join(error_messages)}."
-        
+        # Compile a list of specific error messages for feedback (only when they are shown)
+        examples = '; '.join(f"'{m.context}' -> Suggestion: {m.replacements}" for m in matches[:5])
+    feedback = _GRAMMAR_FEEDBACK[band].format(errors_per_100=errors_per_100, error_count=error_count, examples=examples)
+
     return {
         "name": "Language & Grammar (Error Count)",
         "score": score,
@@ -236,7 +417,18 @@ def calculate_grammar_score(transcript, total_words):
         "raw_score_10": (score / 100) * weight
     }
 
-def calculate_filler_word_rate(transcript, total_words):
+# Filler bands are inclusive upper bounds (rate <= threshold), hence bisect_left
+_FILLER_THRESHOLDS = [1.0, 3.0, 5.0, 10.0]
+_FILLER_SCORES = [100, 80, 60, 40, 20]
+_FILLER_FEEDBACK = [
+    "Excellent clarity ({filler_rate:.2f}% filler rate). No unnecessary filler words found.",
+    "Good clarity ({filler_rate:.2f}% filler rate). Few minor fillers found ({filler_word_count} total). Try to eliminate these.",
+    "Moderate clarity ({filler_rate:.2f}% filler rate). {filler_word_count} fillers found. Focus on speaking more directly.",
+    "Low clarity ({filler_rate:.2f}% filler rate). {filler_word_count} fillers found. This significantly impacts perceived confidence.",
+    "Very low clarity ({filler_rate:.2f}% filler rate). Excessive use of filler words ({filler_word_count} total). Needs immediate attention.",
+]
+
+def calculate_filler_word_rate(transcript_lower, transcript_words, total_words):
     """
     Criterion: Clarity (Filler Word Rate) (Weight: 5) - Adjusted to 5 for total weight 60
     Metric: Filler Word Rate = (Number of filler words / Total words) * 100
@@ -251,30 +443,19 @@ def calculate_filler_word_rate(transcript, total_words):
             "feedback": "Transcript is empty. Assuming perfect clarity.",
             "raw_score_5": weight
         }
-        
-    transcript_words = re.findall(r'\b\w+\b', transcript.lower())
-    
-    filler_word_count = sum(1 for word in transcript_words if word in FILLER_WORDS)
+
+    filler_word_count = (
+        sum(map(_SINGLE_FILLER_WORDS.__contains__, transcript_words))
+        + len(_FILLER_PHRASE_RE.findall(transcript_lower))
+    )
     
     filler_rate = (filler_word_count / total_words) * 100
 
     # Rubric Mapping (Inverse relationship: lower rate = higher score)
     # Target: < 1% (score 100)
-    if filler_rate <= 1.0:
-        score = 100
-        feedback = f"Excellent clarity ({filler_rate:.2f}% filler rate). No unnecessary filler words found."
-    elif filler_rate <= 3.0:
-        score = 80
-        feedback = f"Good clarity ({filler_rate:.2f}% filler rate). Few minor fillers found ({filler_word_count} total). Try to eliminate these."
-    elif filler_rate <= 5.0:
-        score = 60
-        feedback = f"Moderate clarity ({filler_rate:.2f}% filler rate). {filler_word_count} fillers found. Focus on speaking more directly."
-    elif filler_rate <= 10.0:
-        score = 40
-        feedback = f"Low clarity ({filler_rate:.2f}% filler rate). {filler_word_count} fillers found. This significantly impacts perceived confidence."
-    else:
-        score = 20
-        feedback = f"Very low clarity ({filler_rate:.2f}% filler rate). Excessive use of filler words ({filler_word_count} total). Needs immediate attention."
+    band = bisect_left(_FILLER_THRESHOLDS, filler_rate)
+    score = _FILLER_SCORES[band]
+    feedback = _FILLER_FEEDBACK[band].format(filler_rate=filler_rate, filler_word_count=filler_word_count)
 
     return {
         "name": "Clarity (Filler Word Rate)",
@@ -284,24 +465,34 @@ def calculate_filler_word_rate(transcript, total_words):
         "raw_score_5": (score / 100) * weight
     }
 
-def calculate_final_score(transcript):
+def calculate_final_score(transcript, flow_similarities=None):
     """
     The main function to calculate all criterion scores and the overall weighted score.
+    flow_similarities (per target, from calculate_flow_similarities) may be supplied when the
+    transcript was already embedded in a batch.
     """
-    # Pre-processing
-    words = re.findall(r'\b\w+\b', transcript.lower())
+    # Pre-processing (lowercase and tokenize once, shared by all scorers)
+    transcript_lower = transcript.lower()
+    words = _WORD_RE.findall(transcript_lower)
     total_words = len(words)
     
-    if total_words < 10:
+    if total_words < MIN_TRANSCRIPT_WORDS:
         # Prevent scoring for transcripts that are too short to be meaningful
         raise ValueError("Transcript is too short. Please provide at least 10 words for a meaningful analysis.")
     
     # 1. Calculate Per-Criterion Scores (Normalized 0-100)
-    content_score = calculate_key_content_presence(transcript) 
-    flow_score = calculate_flow_and_organization(transcript)     
-    ttr_score = calculate_type_token_ratio(transcript)           
-    grammar_score = calculate_grammar_score(transcript, total_words) 
-    clarity_score = calculate_filler_word_rate(transcript, total_words) 
+    # Grammar (LanguageTool server) and flow (model forward pass) are independent and both
+    # release the GIL, so run them concurrently while the cheap rule-based scorers run here.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        grammar_future = executor.submit(calculate_grammar_score, transcript, total_words)
+        flow_future = executor.submit(calculate_flow_and_organization, transcript, flow_similarities)
+
+        content_score = calculate_key_content_presence(transcript_lower)
+        ttr_score = calculate_type_token_ratio(words)
+        clarity_score = calculate_filler_word_rate(transcript_lower, words, total_words)
+
+        flow_score = flow_future.result()
+        grammar_score = grammar_future.result()
 
     # 2. Compile All Criterion Results
     all_criteria = [
@@ -340,6 +531,9 @@ def calculate_final_score(transcript):
 
 # --- FLASK ROUTES ---
 
+# Upper bound on /score_batch size; each transcript costs a forward pass and a grammar check
+MAX_BATCH_SIZE = 32
+
 @app.route('/')
 def index():
     """Renders the HTML front-end."""
@@ -349,9 +543,14 @@ def index():
 def score():
     """API endpoint to receive transcript and return scores."""
     try:
-        data = request.get_json()
-        transcript = data.get('transcript', '')
+        # The body is only needed once, so skip Flask's parsed-JSON cache
+        data = request.get_json(cache=False, silent=True)
+        if not isinstance(data, dict):
+            return jsonify({"error": "Request body must be a JSON object."}), 400
 
+        transcript = data.get('transcript', '')
+        if not isinstance(transcript, str):
+            return jsonify({"error": "Transcript must be a string."}), 400
         if not transcript:
             return jsonify({"error": "No transcript text provided."}), 400
 
@@ -367,6 +566,47 @@ def score():
         app.logger.error(f"An unexpected error occurred during scoring: {e}")
         return jsonify({"error": f"Internal Server Error: {e}"}), 500
 
+@app.route('/score_batch', methods=['POST'])
+def score_batch():
+    """API endpoint to score a list of transcripts, embedding them in a single batched pass."""
+    try:
+        data = request.get_json(cache=False, silent=True)
+        if not isinstance(data, dict):
+            return jsonify({"error": "Request body must be a JSON object."}), 400
+
+        transcripts = data.get('transcripts', [])
+
+        if not isinstance(transcripts, list) or not transcripts:
+            return jsonify({"error": "No transcripts provided. Send a non-empty list under 'transcripts'."}), 400
+        if not all(isinstance(t, str) for t in transcripts):
+            return jsonify({"error": "Every transcript must be a string."}), 400
+        if len(transcripts) > MAX_BATCH_SIZE:
+            return jsonify({"error": f"Too many transcripts. Send at most {MAX_BATCH_SIZE} per request."}), 400
+
+        # Only embed transcripts long enough to be scored; the rest are rejected below anyway
+        similarities = [None] * len(transcripts)
+        if SEMANTIC_SCORING_ENABLED:
+            scorable = [i for i, t in enumerate(transcripts) if len(_WORD_RE.findall(t.lower())) >= MIN_TRANSCRIPT_WORDS]
+            if scorable:
+                batch_similarities = calculate_flow_similarities([transcripts[i] for i in scorable])
+                for i, target_similarities in zip(scorable, batch_similarities):
+                    similarities[i] = target_similarities
+
+        results = []
+        for transcript, target_similarities in zip(transcripts, similarities):
+            try:
+                results.append(calculate_final_score(transcript, flow_similarities=target_similarities))
+            except ValueError as e:
+                # Report validation errors per transcript instead of failing the whole batch
+                results.append({"error": str(e)})
+        return jsonify({"results": results})
+
+    except Exception as e:
+        app.logger.error(f"An unexpected error occurred during batch scoring: {e}")
+        return jsonify({"error": f"Internal Server Error: {e}"}), 500
+
 if __name__ == '__main__':
+    # Local development only. For production use a WSGI server so requests run in parallel:
+    #   INFERENCE_THREADS=1 gunicorn -w $(nproc) -k gthread --threads 4 -b 0.0.0.0:5000 app:app
     # Using 0.0.0.0 allows it to be accessed via local IP in addition to localhost
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+    app.run(host='0.0.0.0', port=5000, threaded=True)
\ No newline at end of file
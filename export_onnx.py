@@ -0,0 +1,26 @@
+"""
+One-time export of all-MiniLM-L6-v2 to an int8-quantized ONNX model for app.py.
+
+Requires: pip install optimum[exporters] onnxruntime
+Usage:    python export_onnx.py [output_dir]
+"""
+import os
+import sys
+
+from optimum.exporters.onnx import main_export
+from onnxruntime.quantization import QuantType, quantize_dynamic
+
+MODEL_ID = "sentence-transformers/all-MiniLM-L6-v2"
+
+if __name__ == '__main__':
+    output_dir = sys.argv[1] if len(sys.argv) > 1 else "onnx-minilm"
+
+    # 1. Export the FP32 transformer (tokenizer files are saved alongside it)
+    print(f"Exporting {MODEL_ID} to {output_dir}/model.onnx...")
+    main_export(MODEL_ID, output=output_dir, task="feature-extraction")
+
+    # 2. Dynamic int8 quantization of the weights
+    fp32_path = os.path.join(output_dir, "model.onnx")
+    int8_path = os.path.join(output_dir, "model-int8.onnx")
+    quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+    print(f"Quantized model written to {int8_path}. app.py will pick it up on next start.")